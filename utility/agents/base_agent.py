@@ -5,8 +5,12 @@ from typing import Dict, Any
 class BaseAgent(ABC):
     """Base class for all agents in the system"""
     
-    def __init__(self):
-        self.logger = logging.getLogger(self.__class__.__name__)
+    def __init_subclass__(cls, **kwargs):
+        """Resolve one logger per agent class instead of one per instance"""
+        super().__init_subclass__(**kwargs)
+        # Agents may declare their own class-level logger (e.g. the module's)
+        if "logger" not in cls.__dict__:
+            cls.logger = logging.getLogger(cls.__name__)
     
     @abstractmethod
     async def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
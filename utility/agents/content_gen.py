@@ -1,11 +1,30 @@
 
 import os
 import re
+import mmap
+import shutil
+import hashlib
 from datetime import datetime
 from typing import Dict, Any, List
 import logging
+from . import step_gen
 from .step_gen import StepGenerator
 
+_PARAM_RE = re.compile(r"\{[^}]+\}")
+_STEP_KEYWORDS = ("Given", "When", "Then", "And", "But")
+# Feature files above this size are mapped and decoded in one go
+_MMAP_THRESHOLD = 1 << 20
+
+# Digest of the generator's source, so a cached step file never outlives a
+# change to its templates or implementations
+with open(step_gen.__file__, "rb") as _f:
+    _GENERATOR_DIGEST = hashlib.blake2b(_f.read(), digest_size=16).digest()
+del _f
+# Cache file name prefix for the current generator; other prefixes are stale
+_GENERATOR_TAG = _GENERATOR_DIGEST.hex()[:16]
+# Cached step files kept per output directory, most recently used first
+_STEP_CACHE_MAX = 64
+
 
 class ContentGenAgent:
     def __init__(self):
@@ -14,18 +33,59 @@ class ContentGenAgent:
 
     def _normalize_step(self, phrase: str) -> str:
         # Replace parameters like '{recipient}' with '{}'
-        return re.sub(r"\{[^}]+\}", "{}", phrase.strip().lower())
+        return _PARAM_RE.sub("{}", phrase.strip().lower())
         
     def _extract_steps_from_feature(self, feature_path: str) -> List[str]:
         """Extract step phrases from feature file"""
         steps = []
-        step_keywords = ["Given", "When", "Then", "And", "But"]
-        with open(feature_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if any(line.startswith(k) for k in step_keywords):
-                    steps.append(line)
+        with open(feature_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    text = mm[:].decode('utf-8')
+            else:
+                text = f.read().decode('utf-8')
+        for line in text.splitlines():
+            line = line.strip()
+            if line.startswith(_STEP_KEYWORDS):
+                steps.append(line)
         return steps
+
+    def _write_step_file(self, steps: List[str], steps_path: str, cache_dir: str) -> None:
+        """Generate the step file, reusing a cached copy for an identical step list and generator"""
+        digest = hashlib.blake2b(_GENERATOR_DIGEST, digest_size=16)
+        digest.update("\n".join(steps).encode("utf-8"))
+        key = digest.hexdigest()
+        cache_path = os.path.join(cache_dir, f"{_GENERATOR_TAG}-{key}.py")
+        if os.path.exists(cache_path):
+            shutil.copyfile(cache_path, steps_path)
+            # Mark it recently used so pruning keeps it
+            os.utime(cache_path)
+            self.logger.info(f"Reused cached step definitions {cache_path}")
+            return
+        self.step_generator.generate_step_file(steps, steps_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        shutil.copyfile(steps_path, cache_path)
+        self._prune_step_cache(cache_dir)
+
+    def _prune_step_cache(self, cache_dir: str) -> None:
+        """Drop cached step files from other generator versions and all but the newest _STEP_CACHE_MAX"""
+        current, stale = [], []
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if entry.name.startswith(f"{_GENERATOR_TAG}-"):
+                    current.append((entry.stat().st_mtime_ns, entry.path))
+                else:
+                    stale.append(entry.path)
+        current.sort(reverse=True)
+        stale.extend(path for _, path in current[_STEP_CACHE_MAX:])
+        for path in stale:
+            try:
+                os.unlink(path)
+            except OSError as e:
+                self.logger.warning(f"Could not prune cached step file {path}: {e}")
         
     async def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Run content generation"""
@@ -39,12 +99,13 @@ class ContentGenAgent:
         timestamp = os.path.basename(feature_path).split('_')[2].split('.')[0]
         steps_path = os.path.join(os.path.dirname(feature_path), "..", "steps", f"test_steps_{timestamp}.py")
         
-        # Extract steps from feature file
+        # Extract steps from feature file; StepGenerator drops exact repeats itself
         steps = self._extract_steps_from_feature(feature_path)
-        
+
         # Generate step definitions
-        os.makedirs(os.path.dirname(steps_path), exist_ok=True)
-        self.step_generator.generate_step_file(steps, steps_path)
+        orchestrator.ensure_dir(os.path.dirname(steps_path))
+        cache_dir = os.path.join(orchestrator.output_dir, ".stepgen_cache")
+        self._write_step_file(steps, steps_path, cache_dir)
         
         self.logger.info(f"Generated step definitions in {steps_path}")
         
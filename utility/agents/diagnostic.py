@@ -1,12 +1,29 @@
-import re
 import logging
+import re
 from typing import Dict, Any
 from .base_agent import BaseAgent
 
+# Known failure signatures: type -> (pattern, description)
+_ERROR_SIGNATURES = {
+    "config_not_found": (r"No such file or directory: .*?telecom_config\.json", "Configuration file not found"),
+    "connection_refused": (r"Connection refused.*?localhost:8000", "SMS API service not running"),
+    "undefined_steps": (r"undefined.*?step", "Missing step definitions"),
+    "syntax_error": (r"SyntaxError", "Python syntax error in test files"),
+    "assertion_error": (r"AssertionError", "Test assertion failed"),
+    "import_error": (r"ImportError|ModuleNotFoundError", "Missing Python module")
+}
+# All signatures in one case-insensitive alternation; the group name is the type.
+# Branches are zero-width lookaheads so no match swallows another signature
+_ERROR_RE = re.compile(
+    "|".join(f"(?=(?P<{error_type}>{pattern}))" for error_type, (pattern, _) in _ERROR_SIGNATURES.items()),
+    re.IGNORECASE
+)
+_ERROR_DESCRIPTIONS = {error_type: desc for error_type, (_, desc) in _ERROR_SIGNATURES.items()}
+_CRITICAL_ORDER = ("config_not_found", "connection_refused", "undefined_steps",
+                   "syntax_error", "import_error", "assertion_error")
+
 class DiagnosticAgent(BaseAgent):
-    def __init__(self):
-        super().__init__()
-        self.logger = logging.getLogger(__name__)
+    logger = logging.getLogger(__name__)
 
     async def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Diagnose test failures and determine healing strategies"""
@@ -47,33 +64,17 @@ class DiagnosticAgent(BaseAgent):
         # Get raw test output for pattern analysis
         test_output = state.get("test_output", "")
         
-        # Check for specific error patterns
-        error_patterns = {
-            "config_not_found": (r"No such file or directory: .*telecom_config\.json", "Configuration file not found"),
-            "connection_refused": (r"Connection refused.*localhost:8000", "SMS API service not running"),
-            "undefined_steps": (r"undefined.*step", "Missing step definitions"),
-            "syntax_error": (r"SyntaxError", "Python syntax error in test files"),
-            "assertion_error": (r"AssertionError", "Test assertion failed"),
-            "import_error": (r"ImportError|ModuleNotFoundError", "Missing Python module")
-        }
-        
-        found_errors = []
-        for error_type, (pattern, desc) in error_patterns.items():
-            if re.search(pattern, test_output, re.IGNORECASE):
-                found_errors.append({"type": error_type, "description": desc})
+        # Check for specific error patterns in one scan of the output
+        found_errors = {m.lastgroup for m in _ERROR_RE.finditer(test_output)}
         
         if found_errors:
             # Get the most critical error (config > connection > steps)
-            critical_order = ["config_not_found", "connection_refused", "undefined_steps", 
-                            "syntax_error", "import_error", "assertion_error"]
-            for critical_type in critical_order:
-                matching_errors = [e for e in found_errors if e["type"] == critical_type]
-                if matching_errors:
-                    primary_error = matching_errors[0]
-                    state["error_type"] = primary_error["type"]
-                    state["error_specifics"] = primary_error["description"]
+            for critical_type in _CRITICAL_ORDER:
+                if critical_type in found_errors:
+                    state["error_type"] = critical_type
+                    state["error_specifics"] = _ERROR_DESCRIPTIONS[critical_type]
                     state["needs_self_heal"] = True
-                    state["healing_strategy"] = self._determine_healing_strategy(primary_error["type"], True)
+                    state["healing_strategy"] = self._determine_healing_strategy(critical_type, True)
                     state["diagnosed"] = True
                     state["healing_attempts"] = state.get("healing_attempts", 0)
                     state["healing_types"] = state.get("healing_types", [])
@@ -134,11 +135,11 @@ class DiagnosticAgent(BaseAgent):
         state["healing_strategy"] = healing_strategy
         
         # Log diagnostic results
-        self.logger.info(f"🔍 Diagnostic results:")
-        self.logger.info(f"  - Error type: {error_type}")
-        self.logger.info(f"  - Error specifics: {error_specifics}")
-        self.logger.info(f"  - Needs self-healing: {needs_healing}")
-        self.logger.info(f"  - Recommended strategy: {healing_strategy}")
+        self.logger.info("🔍 Diagnostic results:")
+        self.logger.info("  - Error type: %s", error_type)
+        self.logger.info("  - Error specifics: %s", error_specifics)
+        self.logger.info("  - Needs self-healing: %s", needs_healing)
+        self.logger.info("  - Recommended strategy: %s", healing_strategy)
         
         return state
 
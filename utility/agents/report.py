@@ -1,13 +1,29 @@
 import os
+import asyncio
 from typing import Dict, Any
 from datetime import datetime
 
+
+def _fmt_ts(ts: str) -> str:
+    """Format an isoformat timestamp as HH:MM:SS.mmm"""
+    return datetime.fromisoformat(ts).strftime('%H:%M:%S.%f')[:-3]
+
+
+# Escapes user-controlled text for HTML in a single translate pass
+_HTML_TRANS = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+
+
+def _write(path: str, data: str) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(data)
+
+
 class ReportAgent:
-    def _generate_markdown_report(self, results, test_output, error_details=None, execution_log=None, execution_steps=None) -> str:
+    def _generate_markdown_report(self, results, test_output, error_details=None, execution_log=None, execution_steps=None, generated_at: str = None) -> str:
         report = [
             "# Test Execution Report", 
             "", 
-            f"Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 
+            f"Generated at: {generated_at or datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 
             ""
         ]
         
@@ -19,11 +35,11 @@ class ReportAgent:
                 "| Time | Step | Details |",
                 "|------|------|---------|"
             ])
-            for step in execution_steps:
-                timestamp = datetime.fromisoformat(step["timestamp"]).strftime('%H:%M:%S.%f')[:-3]
-                step_name = step["step"]
-                details = str(step.get("details", {})).replace("\n", "<br>")
-                report.append(f"| {timestamp} | {step_name} | {details} |")
+            report.extend([
+                f"| {_fmt_ts(step['timestamp'])} "
+                f"| {step['step']} | {step.get('details_str') or str(step.get('details', {})).replace(chr(10), '<br>')} |"
+                for step in execution_steps
+            ])
             report.append("")
         
         # Add execution log section
@@ -35,11 +51,11 @@ class ReportAgent:
                 "|-----------|-------|----------|"
             ])
             
-            for entry in execution_log:
-                timestamp = datetime.fromisoformat(entry["timestamp"]).strftime('%H:%M:%S.%f')[:-3]
-                event = entry["event"]
-                details = str(entry.get("details", "")).replace("\n", "<br>")
-                report.append(f"| {timestamp} | {event} | {details} |")
+            report.extend([
+                f"| {_fmt_ts(entry['timestamp'])} "
+                f"| {entry['event']} | {entry.get('details_str') or str(entry.get('details', '')).replace(chr(10), '<br>')} |"
+                for entry in execution_log
+            ])
             report.append("")
         
         if error_details:
@@ -65,9 +81,10 @@ class ReportAgent:
                     ])
                 if "steps" in result:
                     report.extend(["**Steps:**", ""])
-                    for step in result["steps"]:
-                        step_status = "✅" if step["status"] == "passed" else "❌"
-                        report.extend([f"{step_status} {step['step']}", ""])
+                    steps = result["steps"]
+                    for step, status in zip(steps["step"], steps["status"]):
+                        report.append(f"{'✅' if status == 'passed' else '❌'} {step}")
+                        report.append("")
                 report.append("")
         else:
             report.extend(["No scenario results available", ""])
@@ -82,7 +99,7 @@ class ReportAgent:
             
         return "\n".join(report)
 
-    def _generate_html_report(self, results, test_output, error_details=None) -> str:
+    def _generate_html_report(self, results, test_output, error_details=None, generated_at: str = None) -> str:
         html = [
             "<!DOCTYPE html>",
             "<html>",
@@ -100,13 +117,13 @@ class ReportAgent:
             "</head>",
             "<body>",
             f"<h1>Test Execution Report</h1>",
-            f"<p>Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>"
+            f"<p>Generated at: {generated_at or datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>"
         ]
         
         if error_details:
             html.extend([
                 "<h2>Error Details</h2>",
-                f"<pre class='error'>{error_details}</pre>"
+                f"<pre class='error'>{str(error_details).translate(_HTML_TRANS)}</pre>"
             ])
         
         html.append("<h2>Scenario Results</h2>")
@@ -117,22 +134,23 @@ class ReportAgent:
                 status_icon = "✅" if result.get("passed") else "❌"
                 html.extend([
                     f"<div class='scenario {status_class}'>",
-                    f"<h3>{result['scenario']} {status_icon}</h3>"
+                    f"<h3>{str(result['scenario']).translate(_HTML_TRANS)} {status_icon}</h3>"
                 ])
                 
                 if not result.get("passed"):
                     html.extend([
                         "<h4>Error Details:</h4>",
                         "<pre class='error'>",
-                        result.get("error_details", "No error details available"),
+                        str(result.get("error_details", "No error details available")).translate(_HTML_TRANS),
                         "</pre>"
                     ])
                 
                 if "steps" in result:
                     html.append("<h4>Steps:</h4>")
-                    for step in result["steps"]:
-                        step_icon = "✅" if step["status"] == "passed" else "❌"
-                        html.append(f"<div class='step'>{step_icon} {step['step']}</div>")
+                    steps = result["steps"]
+                    for step, status in zip(steps["step"], steps["status"]):
+                        step_icon = "✅" if status == "passed" else "❌"
+                        html.append(f"<div class='step'>{step_icon} {str(step).translate(_HTML_TRANS)}</div>")
                 html.append("</div>")
         else:
             html.append("<p>No scenario results available</p>")
@@ -141,7 +159,7 @@ class ReportAgent:
             html.extend([
                 "<h2>Raw Test Output</h2>",
                 "<pre>",
-                test_output,
+                str(test_output).translate(_HTML_TRANS),
                 "</pre>"
             ])
             
@@ -157,13 +175,14 @@ class ReportAgent:
         
         # Create reports directory if it doesn't exist
         reports_dir = os.path.join(orchestrator.output_dir, "reports")
-        os.makedirs(reports_dir, exist_ok=True)
+        orchestrator.ensure_dir(reports_dir)
         
-        # Generate timestamp for report files
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Capture the clock once for file names, headers and the final log entry
+        test_end_time = datetime.now()
+        timestamp = test_end_time.strftime("%Y%m%d_%H%M%S")
+        generated_at = test_end_time.strftime('%Y-%m-%d %H:%M:%S')
         
         # Add final execution status to log
-        test_end_time = datetime.now()
         if state.get("test_start_time"):
             test_duration = (test_end_time - datetime.fromisoformat(state["test_start_time"])).total_seconds()
             execution_log.append({
@@ -176,18 +195,20 @@ class ReportAgent:
                 }
             })
         
-        # Generate and save Markdown report
-        md_content = self._generate_markdown_report(results, test_output, error_details, execution_log)
+        # Generate the Markdown report, plus HTML unless the caller opted out
+        formats = set(state.get("report_formats") or ("md", "html"))
+        md_content = self._generate_markdown_report(results, test_output, error_details, execution_log, generated_at=generated_at)
         md_report_path = os.path.join(reports_dir, f"test_report_{timestamp}.md")
-        with open(md_report_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
-        state["report_path"] = md_report_path
+        writes = [asyncio.to_thread(_write, md_report_path, md_content)]
+        html_report_path = None
+        if "html" in formats:
+            html_content = self._generate_html_report(results, test_output, error_details, generated_at=generated_at)
+            html_report_path = os.path.join(reports_dir, f"test_report_{timestamp}.html")
+            writes.append(asyncio.to_thread(_write, html_report_path, html_content))
         
-        # Generate and save HTML report
-        html_content = self._generate_html_report(results, test_output, error_details)
-        html_report_path = os.path.join(reports_dir, f"test_report_{timestamp}.html")
-        with open(html_report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Save the reports concurrently, off the event loop
+        await asyncio.gather(*writes)
+        state["report_path"] = md_report_path
         state["html_report_path"] = html_report_path
         
-        return state
\ No newline at end of file
+        return state
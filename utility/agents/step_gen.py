@@ -1,74 +1,92 @@
 import re
+import string
 from typing import Dict, List, Optional
 import os
 import datetime
 
+
+class _IdentifierTable(dict):
+    """str.translate table mapping every non-ASCII-alphanumeric char to '_'"""
+
+    _SAFE = frozenset(string.ascii_letters + string.digits)
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        value = char if char in self._SAFE else '_'
+        self[codepoint] = value
+        return value
+
+
+_IDENTIFIER_TABLE = _IdentifierTable()
+
+# Imports and helpers shared by every generated step file
+_STEP_FILE_HEADER = "\n".join([
+    "# AUTOGENERATED - DO NOT EDIT",
+    "from behave import given, when, then",
+    "import requests",
+    "import json",
+    "import os",
+    "import time",
+    "",
+    "def load_config():",
+    '    """Load the telecom API configuration."""',
+    '    config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "telecom_config.json")',
+    '    try:',
+    '        with open(config_path, "r") as f:',
+    '            return json.load(f)',
+    '    except Exception as e:',
+    '        print(f"Error loading config: {e}")',
+    '        return {}',
+    ''
+])
+
+
 class StepGenerator:
     """Generates complete step definitions for BDD feature files"""
     
+    _KEYWORD_PREFIX_RE = re.compile(r'^(Given|When|Then|And|But)\s+', re.IGNORECASE)
+    _STATUS_CODE_RE = re.compile(r'\d+')
+    
     def __init__(self):
         """Initialize step generator"""
         pass
         
     def generate_step_file(self, steps: List[str], output_path: str) -> None:
         """Generate complete step definitions file"""
-        content = [
-            "# AUTOGENERATED - DO NOT EDIT",
-            "from behave import given, when, then",
-            "import requests",
-            "import json",
-            "import os",
-            "import time",
-            "",
-            "def load_config():",
-            '    """Load the telecom API configuration."""',
-            '    config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "telecom_config.json")',
-            '    try:',
-            '        with open(config_path, "r") as f:',
-            '            return json.load(f)',
-            '    except Exception as e:',
-            '        print(f"Error loading config: {e}")',
-            '        return {}',
-            ''
-        ]
-        
-        # Process steps
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(_STEP_FILE_HEADER)
+            f.writelines(self._iter_step_definitions(steps))
+
+    def _iter_step_definitions(self, steps: List[str]):
+        """Yield one step definition block per unique step"""
         seen = set()
         for step in steps:
             # Skip duplicate steps
-            step_normalized = re.sub(r'^(Given|When|Then|And|But)\s+', '', step, flags=re.IGNORECASE)
+            step_normalized = self._KEYWORD_PREFIX_RE.sub('', step)
             if step_normalized in seen:
                 continue
             seen.add(step_normalized)
             
             # Get step type and function name
             step_type = self._get_step_type(step)
-            func_name = re.sub(r'[^a-zA-Z0-9]', '_', step_normalized.lower())
+            func_name = step_normalized.lower().translate(_IDENTIFIER_TABLE)
             if func_name.startswith('_'):
                 func_name = func_name[1:]
             
             # Generate implementation
             impl = self._generate_step_impl(step_normalized, step_type)
             
-            # Add step definition
-            content.extend([
-                f'@{step_type}(r"{step_normalized}")',
-                f'def step_{func_name}(context, recipient=None):',
-                impl,
-                ""
-            ])
-        
-        # Write to file
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(content))
+            yield (
+                f'\n@{step_type}(r"{step_normalized}")\n'
+                f'def step_{func_name}(context, recipient=None):\n'
+                f'{impl}\n'
+            )
 
     def _get_step_type(self, step: str) -> str:
         """Determine the appropriate step type (given/when/then) for a step"""
-        step_lower = step.lower().strip()
-        
         # Remove Given/When/Then/And/But prefix for better matching
-        step_lower = re.sub(r'^(given|when|then|and|but)\s+', '', step_lower, flags=re.IGNORECASE)
+        step_lower = self._KEYWORD_PREFIX_RE.sub('', step.strip().lower())
         
         if "is configured" in step_lower or "configuration exists" in step_lower:
             return "given"
@@ -81,9 +99,18 @@ class StepGenerator:
         """Generate the implementation for a step"""
         normalized = step.lower().strip()
         
-        # Configuration step
-        if "is configured" in normalized:
-            return '''    """Setup the SMS API configuration for testing."""
+        # First matching rule wins
+        for matches, generate in self._IMPL_RULES:
+            if matches(normalized):
+                return generate(self, step)
+
+        # Default implementation
+        return '''    """Step implementation pending."""
+    assert True, "Step not implemented yet"'''
+
+    def _impl_config(self, step: str) -> str:
+        """Configuration step"""
+        return '''    """Setup the SMS API configuration for testing."""
     config = load_config()
     context.base_url = config.get('base_url', 'http://localhost:8000')
     context.api_key = config.get('api_key', 'test_key')
@@ -92,9 +119,9 @@ class StepGenerator:
     context.retry_attempts = config.get('retry_attempts', 3)
     context.retry_delay = config.get('retry_delay', 1)'''
 
-        # Send SMS step
-        elif "send" in normalized and "sms" in normalized:
-            return '''    """Send an SMS message to the specified recipient."""
+    def _impl_send_sms(self, step: str) -> str:
+        """Send SMS step"""
+        return '''    """Send an SMS message to the specified recipient."""
     url = f'{context.base_url}/sms/send'
     data = {
         'recipient': recipient,
@@ -120,26 +147,30 @@ class StepGenerator:
             if attempt < attempts - 1:  # Don't sleep on last attempt
                 time.sleep(context.retry_delay)'''
 
-        # Status code verification
-        elif "receive" in normalized and "response" in normalized:
-            status_match = re.search(r'\d+', step)
-            if status_match:
-                status_code = int(status_match.group())
-                return f'''    """Validate the response status code matches the expected value."""
+    def _impl_status_code(self, step: str) -> str:
+        """Status code verification"""
+        status_match = self._STATUS_CODE_RE.search(step)
+        if status_match:
+            status_code = int(status_match.group())
+            return f'''    """Validate the response status code matches the expected value."""
     assert context.response is not None, "No response received from API"
     assert context.status_code == {status_code}, \\
         f'Expected status code {status_code}, got {{context.status_code}}' '''
-            return '''    """Validate the response status code."""
+        return '''    """Validate the response status code."""
     assert context.response is not None, "No response received from API"'''
 
-        # Message ID verification
-        elif "message id" in normalized:
-            return '''    """Verify response contains message ID."""
+    def _impl_message_id(self, step: str) -> str:
+        """Message ID verification"""
+        return '''    """Verify response contains message ID."""
     assert context.response is not None, "No response received from API"
     response_data = context.response.json()
     assert 'message_id' in response_data, \\
         f'Response missing message_id field: {response_data}' '''
 
-        # Default implementation
-        return '''    """Step implementation pending."""
-    assert True, "Step not implemented yet"'''
+    # (predicate on the normalized step, implementation builder) in priority order
+    _IMPL_RULES = (
+        (lambda n: "is configured" in n, _impl_config),
+        (lambda n: "send" in n and "sms" in n, _impl_send_sms),
+        (lambda n: "receive" in n and "response" in n, _impl_status_code),
+        (lambda n: "message id" in n, _impl_message_id),
+    )
@@ -6,18 +6,172 @@ import json
 import sys
 import asyncio
 import logging
-import subprocess
-from typing import Dict, Any, List, Tuple
+from collections import deque
+from types import MappingProxyType
+from typing import Dict, Any, Deque, List, Mapping, Tuple
 from datetime import datetime
 from .base_agent import BaseAgent
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
 __all__ = ['TestExecAgent']
 
+# Failure signatures in priority order: (type, pattern, description)
+_ERROR_PATTERNS = (
+    ("config_not_found", r"No such file or directory: .*?telecom_config\.json", "Configuration file not found"),
+    ("connection_refused", r"Connection refused.*?localhost:8000", "SMS API service not running"),
+    ("undefined_steps", r"undefined.*?step", "Missing step definitions"),
+    ("syntax_error", r"SyntaxError", "Python syntax error in test files"),
+    ("assertion_error", r"AssertionError", "Test assertion failed"),
+    ("import_error", r"ImportError|ModuleNotFoundError", "Missing Python module"),
+)
+# One alternation over all signatures; the matching group name is the failure type.
+# Each branch is a zero-width lookahead, so a lazy '.*?' in one signature can't
+# consume text that another, higher-priority signature needs
+_FAILURE_RE = re.compile(
+    "|".join(f"(?=(?P<{error_type}>{pattern}))" for error_type, pattern, _ in _ERROR_PATTERNS),
+    re.IGNORECASE
+)
+
+# Case-insensitive summary markers, searched in place rather than on a lowered copy
+_PASSED_RE = re.compile(r"passed", re.IGNORECASE)
+_FAILED_RE = re.compile(r"failed", re.IGNORECASE)
+
+# Shared read-only failure_analysis verdicts, one per failure type
+_FAILURE_VERDICTS = {
+    error_type: MappingProxyType({
+        "failure_type": error_type,
+        "critical_issues": (desc,),
+        "needs_healing": True,
+        "error_type": error_type,
+        "error_details": desc
+    })
+    for error_type, _, desc in _ERROR_PATTERNS
+}
+_UNKNOWN_FAILURE = MappingProxyType({
+    "failure_type": "unknown",
+    "critical_issues": (),
+    "needs_healing": True,
+    "error_type": None,
+    "error_details": None
+})
+
+# Upper bound on retained execution log entries per run
+_EXECUTION_LOG_MAXLEN = 10000
+
+class _LazyJson:
+    """Defer json.dumps until a log handler actually formats the record"""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Any):
+        self.data = data
+
+    def __str__(self) -> str:
+        if orjson is not None:
+            return orjson.dumps(self.data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        return json.dumps(self.data, indent=2)
+
+
+# Error markers that classify a failed behave run, matched case-sensitively in one scan
+_FATAL_ERROR_RE = re.compile(r"SyntaxError|ImportError|ModuleNotFoundError|AssertionError|Assertion Failed:")
+
+# Finds every classified behave output line in one scan of the whole buffer;
+# the matching group name is the line kind
+_LINE_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    r"(?P<scenario>Scenario:)"
+    r"|(?P<step>Given |When |Then )"
+    r"|(?P<failure>AssertionError:|Assertion Failed:|Failed step:)"
+    r"|(?P<error>[^\n]*?(?:ERROR:|FAILED:))"
+    r")[^\n]*",
+    re.MULTILINE
+)
+
+
+
+class _ParseState:
+    """Mutable state threaded through the behave output line handlers"""
+
+    __slots__ = ("results", "timestamp", "current_scenario")
+
+    def __init__(self, results: List[Dict[str, Any]], timestamp: str):
+        self.results = results
+        self.timestamp = timestamp
+        self.current_scenario = None
+
+
+def _on_scenario(parse_state: _ParseState, line: str) -> None:
+    """Detect scenario start"""
+    parse_state.current_scenario = {
+        "scenario": line[len("Scenario:"):].strip(),
+        "passed": True,
+        # Columnar step records: one list per field, indexed by step position
+        "steps": {"step": [], "status": [], "details": []},
+        "timestamp": parse_state.timestamp
+    }
+    parse_state.results.append(parse_state.current_scenario)
+
+
+def _on_step(parse_state: _ParseState, line: str) -> None:
+    """Detect step results"""
+    if parse_state.current_scenario:
+        steps = parse_state.current_scenario["steps"]
+        steps["step"].append(line)
+        steps["status"].append("passed")
+        steps["details"].append("")
+
+
+def _on_step_failure(parse_state: _ParseState, line: str) -> None:
+    """Detect step failures"""
+    scenario = parse_state.current_scenario
+    if scenario:
+        scenario["passed"] = False
+        scenario["error_type"] = "AssertionError"
+        scenario["error_details"] = line
+        # Mark the last step as failed
+        steps = scenario["steps"]
+        if steps["step"]:
+            steps["status"][-1] = "failed"
+            steps["details"][-1] = line
+
+
+def _on_error(parse_state: _ParseState, line: str) -> None:
+    """Detect other errors"""
+    scenario = parse_state.current_scenario
+    if scenario:
+        scenario["passed"] = False
+        scenario["error_type"] = "ExecutionError"
+        scenario["error_details"] = line
+
+
+# _LINE_RE group name -> handler
+_LINE_HANDLERS = {
+    "scenario": _on_scenario,
+    "step": _on_step,
+    "failure": _on_step_failure,
+    "error": _on_error,
+}
+
+
+def _log_entry(timestamp: datetime, event: str, details: Any) -> Dict[str, Any]:
+    """Build an execution log entry, rendering its report cell once up front"""
+    return {
+        "timestamp": timestamp.isoformat(),
+        "event": event,
+        "details": details,
+        "details_str": str(details).replace("\n", "<br>")
+    }
+
 
 class TestExecAgent(BaseAgent):
+    logger = logging.getLogger(__name__)
+
     def __init__(self):
         super().__init__()
-        self.logger = logging.getLogger(__name__)
         self.execution_steps = []
         self.step_timings = {}
         
@@ -27,110 +181,85 @@ class TestExecAgent(BaseAgent):
         step_info = {
             "step": step_name,
             "timestamp": timestamp.isoformat(),
-            "details": details or {}
+            "details": details or {},
+            "details_str": str(details or {}).replace("\n", "<br>")
         }
         self.execution_steps.append(step_info)
         self.step_timings[step_name] = timestamp
-        self.logger.info(f"Step: {step_name} - {json.dumps(details, indent=2) if details else 'No details'}")
+        self.logger.info("Step: %s - %s", step_name, _LazyJson(details) if details else "No details")
         
-    def _run_behave_tests(self, feature_path: str) -> tuple[int, str, List[Dict[str, Any]]]:
+    async def _run_behave_tests(self, feature_path: str) -> Tuple[int, str, Deque[Dict[str, Any]]]:
         """Execute behave tests using subprocess with detailed logging."""
-        execution_log = []
+        execution_log = deque(maxlen=_EXECUTION_LOG_MAXLEN)
         try:
             # Log test start
             start_time = datetime.now()
-            execution_log.append({
-                "timestamp": start_time.isoformat(),
-                "event": "test_start",
-                "details": {"feature_path": feature_path}
-            })
+            execution_log.append(_log_entry(start_time, "test_start", {"feature_path": feature_path}))
             
             # Check feature file exists
             if not os.path.exists(feature_path):
-                execution_log.append({
-                    "timestamp": datetime.now().isoformat(),
-                    "event": "error",
-                    "details": {"error": f"Feature file not found: {feature_path}"}
-                })
+                execution_log.append(_log_entry(datetime.now(), "error", {"error": f"Feature file not found: {feature_path}"}))
                 return 1, f"Feature file not found: {feature_path}", execution_log
             
-            # Log feature file content
+            # Log feature file metadata; the full content only when debugging
             try:
-                with open(feature_path, 'r') as f:
-                    feature_content = f.read()
-                    execution_log.append({
-                        "timestamp": datetime.now().isoformat(),
-                        "event": "feature_file_read",
-                        "details": {"content": feature_content}
-                    })
+                st = os.stat(feature_path)
+                details = {"size": st.st_size, "mtime": st.st_mtime}
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    with open(feature_path, 'r') as f:
+                        details["content"] = f.read()
+                execution_log.append(_log_entry(datetime.now(), "feature_file_read", details))
             except Exception as e:
-                execution_log.append({
-                    "timestamp": datetime.now().isoformat(),
-                    "event": "error",
-                    "details": {"error": f"Failed to read feature file: {str(e)}"}
-                })
+                execution_log.append(_log_entry(datetime.now(), "error", {"error": f"Failed to read feature file: {str(e)}"}))
             
             # Execute behave with detailed output
             command = [sys.executable, "-m", "behave", feature_path, 
                       "--no-capture", "--format=plain", "--show-timings"]
             
-            execution_log.append({
-                "timestamp": datetime.now().isoformat(),
-                "event": "command_start",
-                "details": {"command": " ".join(command)}
-            })
+            execution_log.append(_log_entry(datetime.now(), "command_start", {"command": " ".join(command)}))
             
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                check=False
+            # Merge stderr into stdout and collect it without blocking the event loop
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT
             )
+            try:
+                raw_output, _ = await process.communicate()
+            except BaseException:
+                # Don't leave behave blocked on a pipe nobody reads
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+                raise
+            return_code = process.returncode
+            output = raw_output.decode("utf-8", errors="replace")
             
-            output = result.stdout + result.stderr
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
             
             # Log execution details
-            execution_log.append({
-                "timestamp": end_time.isoformat(),
-                "event": "command_complete",
-                "details": {
-                    "return_code": result.returncode,
-                    "duration": duration,
-                    "output": output
-                }
-            })
+            execution_log.append(_log_entry(end_time, "command_complete", {
+                "return_code": return_code,
+                "duration": duration,
+                "output": output
+            }))
             
             self.logger.info("=" * 80)
-            self.logger.info(f"Test Execution Summary:")
-            self.logger.info(f"Feature: {feature_path}")
-            self.logger.info(f"Duration: {duration:.2f} seconds")
-            self.logger.info(f"Return Code: {result.returncode}")
+            self.logger.info("Test Execution Summary:")
+            self.logger.info("Feature: %s", feature_path)
+            self.logger.info("Duration: %.2f seconds", duration)
+            self.logger.info("Return Code: %s", return_code)
             self.logger.info("=" * 80)
             self.logger.info("Detailed Output:")
             self.logger.info(output)
             self.logger.info("=" * 80)
             
-            return result.returncode, output, execution_log
-            
-        except subprocess.CalledProcessError as e:
-            error_details = f"Behave execution failed: {str(e)}"
-            execution_log.append({
-                "timestamp": datetime.now().isoformat(),
-                "event": "error",
-                "details": {"error": error_details}
-            })
-            self.logger.error(error_details)
-            return e.returncode, e.output, execution_log
+            return return_code, output, execution_log
             
         except Exception as e:
             error_details = f"Unexpected error during test execution: {str(e)}"
-            execution_log.append({
-                "timestamp": datetime.now().isoformat(),
-                "event": "error",
-                "details": {"error": error_details}
-            })
+            execution_log.append(_log_entry(datetime.now(), "error", {"error": error_details}))
             self.logger.error(error_details)
             return 1, str(e), execution_log
 
@@ -141,9 +270,10 @@ class TestExecAgent(BaseAgent):
             "feature_path": state.get("feature_path")
         })
         
-        # Initialize state with detailed execution tracking
+        # Collect every state change locally and apply it with one update
         start_time = datetime.now()
-        state.update({
+        execution_log = deque(maxlen=_EXECUTION_LOG_MAXLEN)
+        updates = {
             "test_passed": False,
             "test_executed": False,
             "test_exec_result": None,
@@ -153,84 +283,43 @@ class TestExecAgent(BaseAgent):
             "error_details": None,
             "error_specifics": {},
             "current_step": "test_exec",
-            "execution_log": [],
+            "execution_log": execution_log,
             "test_start_time": start_time.isoformat(),
             "execution_steps": self.execution_steps,
             "step_timings": self.step_timings
-        })
+        }
         
         # Log initial state
-        state["execution_log"].append({
-            "timestamp": state["test_start_time"],
-            "event": "execution_start",
-            "details": {
-                "user_story": state.get("user_story"),
-                "feature_path": state.get("feature_path"),
-                "step_definitions_path": state.get("step_definitions_path")
-            }
-        })
+        execution_log.append(_log_entry(start_time, "execution_start", {
+            "user_story": state.get("user_story"),
+            "feature_path": state.get("feature_path"),
+            "step_definitions_path": state.get("step_definitions_path")
+        }))
         
         # Validate project paths
         if not state.get("feature_path"):
             error_msg = "Feature file path not found"
-            state.update({
-                "error_type": "missing_path",
-                "error_details": error_msg,
-                "execution_log": state["execution_log"] + [{
-                    "timestamp": datetime.now().isoformat(),
-                    "event": "error",
-                    "details": {"error": error_msg}
-                }]
-            })
+            execution_log.append(_log_entry(datetime.now(), "error", {"error": error_msg}))
+            updates["error_type"] = "missing_path"
+            updates["error_details"] = error_msg
+            state.update(updates)
             return state
         
         # Run behave tests with detailed logging
-        exit_code, output, test_execution_log = self._run_behave_tests(state["feature_path"])
-        state["execution_log"].extend(test_execution_log)
+        exit_code, output, test_execution_log = await self._run_behave_tests(state["feature_path"])
+        execution_log.extend(test_execution_log)
         
         # Parse results and analyze failures with detailed logging
-        scenario_results = self._parse_behave_output(output, exit_code)
+        scenario_results, failure_analysis = self._analyze_behave_output(output, exit_code)
         
         # Log parsing results
-        state["execution_log"].append({
-            "timestamp": datetime.now().isoformat(),
-            "event": "results_parsed",
-            "details": {
-                "num_scenarios": len(scenario_results),
-                "scenarios": scenario_results
-            }
-        })
-        
-        # Add failure analysis
-        error_patterns = {
-            "config_not_found": (r"No such file or directory: .*telecom_config\.json", "Configuration file not found"),
-            "connection_refused": (r"Connection refused.*localhost:8000", "SMS API service not running"),
-            "undefined_steps": (r"undefined.*step", "Missing step definitions"),
-            "syntax_error": (r"SyntaxError", "Python syntax error in test files"),
-            "assertion_error": (r"AssertionError", "Test assertion failed"),
-            "import_error": (r"ImportError|ModuleNotFoundError", "Missing Python module")
-        }
-        
-        # Analyze failures
-        failure_analysis = {
-            "failure_type": "unknown",
-            "critical_issues": [],
-            "needs_healing": True,
-            "error_type": None,
-            "error_details": None
-        }
-        
-        # Check for error patterns
-        for error_type, (pattern, desc) in error_patterns.items():
-            if re.search(pattern, output, re.IGNORECASE):
-                failure_analysis["failure_type"] = error_type
-                failure_analysis["critical_issues"].append(desc)
-                failure_analysis["error_type"] = error_type
-                failure_analysis["error_details"] = desc
-                break
+        execution_log.append(_log_entry(datetime.now(), "results_parsed", {
+            "num_scenarios": len(scenario_results),
+            "num_failed": sum(1 for r in scenario_results if not r.get("passed"))
+        }))
         
         # Update state with results
-        state.update({
+        updates.update({
             "test_output": output,
             "test_executed": True,
             "test_passed": exit_code == 0,
@@ -241,45 +330,56 @@ class TestExecAgent(BaseAgent):
             "error_type": failure_analysis.get("error_type", "test_failure") if exit_code != 0 else None,
             "error_details": failure_analysis.get("error_details", output) if exit_code != 0 else None
         })
+        state.update(updates)
         
         return state
 
+    def _analyze_behave_output(self, output: str, return_code: int) -> Tuple[List[Dict[str, Any]], Mapping[str, Any]]:
+        """Parse scenario results and classify the failure by the highest-priority signature found."""
+        failures = frozenset(m.lastgroup for m in _FAILURE_RE.finditer(output))
+        
+        # Take the verdict of the highest-priority failure found
+        failure_analysis = _UNKNOWN_FAILURE
+        for error_type, _, _ in _ERROR_PATTERNS:
+            if error_type in failures:
+                failure_analysis = _FAILURE_VERDICTS[error_type]
+                break
+        
+        return self._parse_behave_output(output, return_code), failure_analysis
+
     def _parse_behave_output(self, output: str, return_code: int) -> List[Dict[str, Any]]:
         """Parse behave output to extract detailed scenario results."""
         results = []
+        # One timestamp for every record produced by this parse
+        parsed_at = datetime.now().isoformat()
         
         # Check if behave command failed completely
         if return_code != 0:
-            # Parse error output for specific failures
-            error_lines = [line.strip() for line in output.splitlines() if line.strip()]
-            
-            # Look for specific error patterns
-            if "SyntaxError" in output:
+            # Look for specific error patterns, keeping their priority order
+            found = set(_FATAL_ERROR_RE.findall(output))
+            if "SyntaxError" in found:
                 results.append({
                     "scenario": "Framework Setup",
                     "passed": False,
                     "error_type": "SyntaxError",
                     "error_details": "Python syntax error in test files",
-                    "output": output,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": parsed_at
                 })
-            elif "ImportError" in output or "ModuleNotFoundError" in output:
+            elif "ImportError" in found or "ModuleNotFoundError" in found:
                 results.append({
                     "scenario": "Framework Setup",
                     "passed": False,
                     "error_type": "ImportError",
                     "error_details": "Missing dependencies or import issues",
-                    "output": output,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": parsed_at
                 })
-            elif "AssertionError" in output or "Assertion Failed:" in output:
+            elif "AssertionError" in found or "Assertion Failed:" in found:
                 results.append({
                     "scenario": "Test Execution",
                     "passed": False,
                     "error_type": "AssertionError",
                     "error_details": "Test assertions failed",
-                    "output": output,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": parsed_at
                 })
             else:
                 results.append({
@@ -287,63 +387,24 @@ class TestExecAgent(BaseAgent):
                     "passed": False,
                     "error_type": "ExecutionError",
                     "error_details": f"Test execution failed with return code {return_code}",
-                    "output": output,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": parsed_at
                 })
             return results
         
-        # Parse successful behave output
-        current_scenario = None
-        for line in output.splitlines():
-            line = line.strip()
-            
-            # Detect scenario start
-            if line.startswith("Scenario:"):
-                scenario_name = line.split("Scenario:", 1)[1].strip()
-                current_scenario = {
-                    "scenario": scenario_name,
-                    "passed": True,
-                    "steps": [],
-                    "timestamp": datetime.now().isoformat()
-                }
-                results.append(current_scenario)
-            
-            # Detect step results
-            elif line.startswith("Given ") or line.startswith("When ") or line.startswith("Then "):
-                if current_scenario:
-                    step_result = {
-                        "step": line,
-                        "status": "passed",
-                        "details": ""
-                    }
-                    current_scenario["steps"].append(step_result)
-            
-            # Detect step failures
-            elif line.startswith("AssertionError:") or line.startswith("Assertion Failed:") or line.startswith("Failed step:"):
-                if current_scenario:
-                    current_scenario["passed"] = False
-                    current_scenario["error_type"] = "AssertionError"
-                    current_scenario["error_details"] = line
-                    # Mark the last step as failed
-                    if current_scenario["steps"]:
-                        current_scenario["steps"][-1]["status"] = "failed"
-                        current_scenario["steps"][-1]["details"] = line
-            
-            # Detect other errors
-            elif "ERROR:" in line or "FAILED:" in line:
-                if current_scenario:
-                    current_scenario["passed"] = False
-                    current_scenario["error_type"] = "ExecutionError"
-                    current_scenario["error_details"] = line
+        # Parse successful behave output, dispatching on the matched line kind;
+        # without any scenario header no line can land in a result, so skip the scan
+        if "Scenario:" in output:
+            parse_state = _ParseState(results, parsed_at)
+            for match in _LINE_RE.finditer(output):
+                _LINE_HANDLERS[match.lastgroup](parse_state, match.group().strip())
         
         # If no scenarios were parsed, create a summary result
         if not results:
-            if "passed" in output.lower() and "failed" not in output.lower():
+            if _PASSED_RE.search(output) and not _FAILED_RE.search(output):
                 results.append({
                     "scenario": "Overall Test Execution",
                     "passed": True,
-                    "output": output,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": parsed_at
                 })
             else:
                 results.append({
@@ -351,8 +412,7 @@ class TestExecAgent(BaseAgent):
                     "passed": False,
                     "error_type": "UnknownError",
                     "error_details": "Could not parse test results",
-                    "output": output,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": parsed_at
                 })
         
         return results
@@ -1,5 +1,11 @@
+import atexit
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# Log directories already created by this process
+_ENSURED_DIRS = set()
 
 
 def setup_logger(name: str = "telecom") -> logging.Logger:
@@ -20,10 +26,18 @@ def setup_logger(name: str = "telecom") -> logging.Logger:
 
     log_file = os.getenv("LOG_FILE", os.path.join(".", "logs", "execution.log"))
     try:
-        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        log_dir = os.path.dirname(log_file)
+        if log_dir not in _ENSURED_DIRS:
+            os.makedirs(log_dir, exist_ok=True)
+            _ENSURED_DIRS.add(log_dir)
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        # Hand records to a background thread so callers never wait on file I/O
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(QueueHandler(log_queue))
     except Exception:
         # Fallback to console only
         pass
@@ -1,157 +1,21 @@
 import os
-from datetime import datetime
-from collections import defaultdict
+import re
+import sys
+import time
+from datetime import timedelta
+from dataclasses import dataclass, field
+from typing import List, Optional
 
-class TestReporter:
-    def __init__(self):
-        self.features = defaultdict(dict)
-        self.current_feature = None
-        self.current_scenario = None
-        self.current_step = None
-        
-    def start_feature(self, feature_name):
-        """Record the start of a feature"""
-        self.current_feature = feature_name
-        self.features[feature_name] = {
-            'scenarios': defaultdict(dict),
-            'start_time': datetime.now(),
-            'status': 'passed'
-        }
+try:
+    from markupsafe import escape as _escape
+except ImportError:  # markupsafe is optional; fall back to a translate table
+    _ESCAPE_TRANS = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
 
-    def end_feature(self, feature_name, duration):
-        """Record the end of a feature"""
-        self.features[feature_name]['duration'] = duration
-        # Feature fails if any scenario failed
-        for scenario in self.features[feature_name]['scenarios'].values():
-            if scenario['status'] == 'failed':
-                self.features[feature_name]['status'] = 'failed'
-                break
+    def _escape(value):
+        return str(value).translate(_ESCAPE_TRANS)
 
-    def start_scenario(self, scenario_name):
-        """Record the start of a scenario"""
-        self.current_scenario = scenario_name
-        self.features[self.current_feature]['scenarios'][scenario_name] = {
-            'steps': defaultdict(dict),
-            'start_time': datetime.now(),
-            'status': 'passed'
-        }
-
-    def end_scenario(self, scenario_name, status, duration):
-        """Record the end of a scenario"""
-        self.features[self.current_feature]['scenarios'][scenario_name].update({
-            'status': status,
-            'duration': duration
-        })
-
-    def start_step(self, step_name):
-        """Record the start of a step"""
-        self.current_step = step_name
-        self.features[self.current_feature]['scenarios'][self.current_scenario]['steps'][step_name] = {
-            'start_time': datetime.now(),
-            'status': 'pending'
-        }
-
-    def end_step(self, step_name, status, duration, error_message=None):
-        """Record the end of a step"""
-        step_data = {
-            'status': status,
-            'duration': duration
-        }
-        if error_message:
-            step_data['error_message'] = error_message
-        
-        self.features[self.current_feature]['scenarios'][self.current_scenario]['steps'][step_name].update(step_data)
-        
-        # If step failed, mark scenario as failed
-        if status == 'failed':
-            self.features[self.current_feature]['scenarios'][self.current_scenario]['status'] = 'failed'
-
-    def generate_report(self, output_file):
-        """Generate HTML report from collected test data"""
-        html = self._get_report_header()
-        
-        # Summary section
-        total_features = len(self.features)
-        passed_features = sum(1 for f in self.features.values() if f['status'] == 'passed')
-        total_scenarios = sum(len(f['scenarios']) for f in self.features.values())
-        passed_scenarios = sum(
-            sum(1 for s in f['scenarios'].values() if s['status'] == 'passed')
-            for f in self.features.values()
-        )
-        
-        html += f'''
-        <div class="summary">
-            <h2>Test Execution Summary</h2>
-            <p>Features: {passed_features}/{total_features} passed</p>
-            <p>Scenarios: {passed_scenarios}/{total_scenarios} passed</p>
-        </div>
-        '''
-        
-        # Feature details
-        for feature_name, feature_data in self.features.items():
-            status_class = 'passed' if feature_data['status'] == 'passed' else 'failed'
-            duration = feature_data['duration'].total_seconds()
-            
-            html += f'''
-            <div class="feature {status_class}">
-                <h2>Feature: {feature_name}</h2>
-                <p>Status: {feature_data['status']}</p>
-                <p>Duration: {duration:.2f}s</p>
-                
-                <div class="scenarios">
-            '''
-            
-            # Scenario details
-            for scenario_name, scenario_data in feature_data['scenarios'].items():
-                status_class = 'passed' if scenario_data['status'] == 'passed' else 'failed'
-                duration = scenario_data['duration'].total_seconds()
-                
-                html += f'''
-                <div class="scenario {status_class}">
-                    <h3>Scenario: {scenario_name}</h3>
-                    <p>Status: {scenario_data['status']}</p>
-                    <p>Duration: {duration:.2f}s</p>
-                    
-                    <div class="steps">
-                '''
-                
-                # Step details
-                for step_name, step_data in scenario_data['steps'].items():
-                    status_class = step_data['status'].lower()
-                    duration = step_data['duration'].total_seconds()
-                    
-                    html += f'''
-                    <div class="step {status_class}">
-                        <p>{step_name}</p>
-                        <p>Status: {step_data['status']}</p>
-                        <p>Duration: {duration:.2f}s</p>
-                    '''
-                    
-                    if 'error_message' in step_data:
-                        html += f'''
-                        <div class="error">
-                            <pre>{step_data['error_message']}</pre>
-                        </div>
-                        '''
-                    
-                    html += '</div>'  # Close step
-                
-                html += '</div></div>'  # Close steps and scenario
-            
-            html += '</div></div>'  # Close scenarios and feature
-        
-        html += self._get_report_footer()
-        
-        # Ensure the output directory exists
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        
-        # Write the report
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html)
-
-    def _get_report_header(self):
-        """Returns the HTML header with CSS styling"""
-        return '''
+# Static report boilerplate, written verbatim around the generated body
+_RAW_REPORT_HEADER = '''
         <!DOCTYPE html>
         <html>
         <head>
@@ -217,9 +81,223 @@ class TestReporter:
             <h1>BDD Test Execution Report</h1>
         '''
 
-    def _get_report_footer(self):
-        """Returns the HTML footer"""
-        return '''
+# Minified once at import: collapse whitespace runs and drop the padding
+# around CSS punctuation. The header has no <pre> content to preserve.
+_REPORT_HEADER = re.sub(
+    r'\s*([{};:,])\s*', r'\1', re.sub(r'\s+', ' ', _RAW_REPORT_HEADER)
+).strip() + '\n'
+
+_REPORT_FOOTER = '''
         </body>
         </html>
         '''
+
+# Per-item report fragments, filled with str.format
+_SUMMARY_TMPL = '''
+        <div class="summary">
+            <h2>Test Execution Summary</h2>
+            <p>Features: {passed_features}/{total_features} passed</p>
+            <p>Scenarios: {passed_scenarios}/{total_scenarios} passed</p>
+        </div>
+        '''
+
+_FEATURE_OPEN_TMPL = '''
+            <div class="feature {status_class}">
+                <h2>Feature: {name}</h2>
+                <p>Status: {status}</p>
+                <p>Duration: {duration:.2f}s</p>
+                
+                <div class="scenarios">
+            '''
+
+_SCENARIO_OPEN_TMPL = '''
+                <div class="scenario {status_class}">
+                    <h3>Scenario: {name}</h3>
+                    <p>Status: {status}</p>
+                    <p>Duration: {duration:.2f}s</p>
+                    
+                    <div class="steps">
+                '''
+
+_STEP_TMPL = '''
+                    <div class="step {status_class}">
+                        <p>{name}</p>
+                        <p>Status: {status}</p>
+                        <p>Duration: {duration:.2f}s</p>
+                    '''
+
+_STEP_ERROR_TMPL = '''
+                        <div class="error">
+                            <pre>{error_message}</pre>
+                        </div>
+                        '''
+
+# Feature/scenario CSS class by status; anything other than a pass renders as failed
+_STATUS_CLASS = {'passed': 'passed', 'failed': 'failed'}
+
+
+def _elapsed(start_time, duration):
+    """Duration in seconds: the caller's value if given, else time since start_time"""
+    if duration is None:
+        return time.perf_counter() - start_time
+    if isinstance(duration, timedelta):
+        return duration.total_seconds()
+    return float(duration)
+
+
+# dataclass(slots=...) only exists on 3.10+; older interpreters get plain dataclasses
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
+class Step:
+    name: str
+    start_time: float
+    status: str = 'pending'
+    duration: float = 0.0
+    error_message: Optional[str] = None
+
+
+@dataclass(**_SLOTS)
+class Scenario:
+    name: str
+    start_time: float
+    status: str = 'passed'
+    duration: float = 0.0
+    steps: List[Step] = field(default_factory=list)
+
+
+@dataclass(**_SLOTS)
+class Feature:
+    name: str
+    start_time: float
+    status: str = 'passed'
+    duration: float = 0.0
+    scenarios: List[Scenario] = field(default_factory=list)
+
+
+class TestReporter:
+    def __init__(self):
+        self.features: List[Feature] = []
+        self.current_feature = None
+        self.current_scenario = None
+        self.current_step = None
+        # Records currently being filled in, updated in place by the end_* calls
+        self._feature = None
+        self._scenario = None
+        self._step = None
+        # Summary counters, maintained as results are recorded
+        self.total_features = self.passed_features = 0
+        self.total_scenarios = self.passed_scenarios = 0
+        # Output directories already created by generate_report
+        self._ensured_dirs = set()
+        
+    def start_feature(self, feature_name):
+        """Record the start of a feature"""
+        self.current_feature = feature_name
+        self._feature = Feature(feature_name, time.perf_counter())
+        self.features.append(self._feature)
+        self.total_features += 1
+
+    def end_feature(self, feature_name, duration=None):
+        """Record the end of a feature"""
+        feature = self._feature
+        feature.duration = _elapsed(feature.start_time, duration)
+        if feature.status == 'passed':
+            self.passed_features += 1
+
+    def start_scenario(self, scenario_name):
+        """Record the start of a scenario"""
+        self.current_scenario = scenario_name
+        self._scenario = Scenario(scenario_name, time.perf_counter())
+        self._feature.scenarios.append(self._scenario)
+        self.total_scenarios += 1
+
+    def end_scenario(self, scenario_name, status, duration=None):
+        """Record the end of a scenario"""
+        scenario = self._scenario
+        scenario.status = status = status.lower()
+        scenario.duration = _elapsed(scenario.start_time, duration)
+        if status == 'passed':
+            self.passed_scenarios += 1
+        elif status == 'failed':
+            # Feature fails if any scenario failed
+            self._feature.status = 'failed'
+
+    def start_step(self, step_name):
+        """Record the start of a step"""
+        self.current_step = step_name
+        self._step = Step(step_name, time.perf_counter())
+        self._scenario.steps.append(self._step)
+
+    def end_step(self, step_name, status, duration=None, error_message=None):
+        """Record the end of a step"""
+        step = self._step
+        step.status = status = status.lower()
+        step.duration = _elapsed(step.start_time, duration)
+        if error_message:
+            step.error_message = error_message
+        
+        # If step failed, mark scenario and feature as failed
+        if status == 'failed':
+            self._scenario.status = 'failed'
+            self._feature.status = 'failed'
+
+    def generate_report(self, output_file):
+        """Generate HTML report from collected test data"""
+        # Ensure the output directory exists
+        output_dir = os.path.dirname(output_file)
+        if output_dir and output_dir not in self._ensured_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            self._ensured_dirs.add(output_dir)
+        
+        # Stream the report to disk in document order
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            write = f.write
+            write(_REPORT_HEADER)
+            
+            # Summary section
+            write(_SUMMARY_TMPL.format(
+                passed_features=self.passed_features,
+                total_features=self.total_features,
+                passed_scenarios=self.passed_scenarios,
+                total_scenarios=self.total_scenarios
+            ))
+            
+            # Feature details
+            for feature in self.features:
+                write(_FEATURE_OPEN_TMPL.format(
+                    status_class=_STATUS_CLASS.get(feature.status, 'failed'),
+                    name=_escape(feature.name),
+                    status=feature.status,
+                    duration=feature.duration
+                ))
+                
+                # Scenario details
+                for scenario in feature.scenarios:
+                    write(_SCENARIO_OPEN_TMPL.format(
+                        status_class=_STATUS_CLASS.get(scenario.status, 'failed'),
+                        name=_escape(scenario.name),
+                        status=scenario.status,
+                        duration=scenario.duration
+                    ))
+                    
+                    # Step details
+                    for step in scenario.steps:
+                        write(_STEP_TMPL.format(
+                            status_class=step.status,
+                            name=_escape(step.name),
+                            status=step.status,
+                            duration=step.duration
+                        ))
+                        
+                        if step.error_message:
+                            write(_STEP_ERROR_TMPL.format(error_message=_escape(step.error_message)))
+                        
+                        write('</div>')  # Close step
+                    
+                    write('</div></div>')  # Close steps and scenario
+                
+                write('</div></div>')  # Close scenarios and feature
+            
+            write(_REPORT_FOOTER)
@@ -6,7 +6,8 @@ Automatically handles dependencies and launches the main application.
 
 import sys
 import os
-import subprocess
+import asyncio
+import importlib.util
 from pathlib import Path
 
 
@@ -16,7 +17,7 @@ def main():
     print("=" * 40)
     
     # Check if we're in the right directory
-    if not Path("telecom_ai_langgraph.py").exists():
+    if not Path("telecom_ai_langgraph.py").is_file():
         print("❌ Error: telecom_ai_langgraph.py not found in current directory")
         print("Please run this script from the project root directory")
         sys.exit(1)
@@ -29,24 +30,40 @@ def main():
     
     print(f"✓ Python {sys.version_info.major}.{sys.version_info.minor} detected")
     
+    # List utility/ once and check the support files against that
+    try:
+        utility_entries = {entry.name for entry in os.scandir("utility")}
+    except OSError:
+        utility_entries = set()
+    
     # Check if requirements.txt exists
-    if Path("utility/requirements.txt").exists():
+    if "requirements.txt" in utility_entries:
         print("✓ requirements.txt found")
     else:
         print("⚠️  requirements.txt not found")
     
     # Check if dependency_installer.py exists
-    if Path("utility/dependency_installer.py").exists():
+    if "dependency_installer.py" in utility_entries:
         print("✓ dependency_installer.py found")
         
-        # Run dependency installer first
+        # Run dependency installer first, in-process rather than in a second interpreter;
+        # load the very file checked above, not whatever sys.path resolves first
         print("\n🔧 Running dependency installer...")
         try:
-            result = subprocess.run([sys.executable, "utility/dependency_installer.py"], check=True)
-            print("✓ Dependencies verified/installed")
-        except subprocess.CalledProcessError:
-            print("❌ Dependency installation failed")
+            spec = importlib.util.spec_from_file_location(
+                "dependency_installer", os.path.join("utility", "dependency_installer.py")
+            )
+            installer = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(installer)
+            installed = installer.DependencyInstaller().run()
+        except Exception as e:
+            print(f"❌ Dependency installer error: {e}")
+            installed = False
+        if not installed:
+            print("\n❌ Dependency installation failed. Please check the errors above.")
             sys.exit(1)
+        print("\n✅ Ready to run your application!")
+        print("✓ Dependencies verified/installed")
     else:
         print("⚠️  dependency_installer.py not found, will attempt direct execution")
     
@@ -54,11 +71,13 @@ def main():
     print("\n🚀 Launching Telecom AI LangGraph...")
     print("=" * 40)
     
+    # The application is only imported once the checks above have passed. When the
+    # installer ran in-process, its import check has already loaded LangGraph and
+    # the other required packages, so this mostly binds modules already in sys.modules
     try:
         import telecom_ai_langgraph as app
         args = app.parse_arguments()
         initial_state = app.create_initial_state(args)
-        import asyncio
         asyncio.run(app.run_main_workflow(initial_state, recursion_limit=args.recursion_limit))
     except ImportError as e:
         print(f"❌ Import error: {e}")
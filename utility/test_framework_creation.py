@@ -14,6 +14,20 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from telecom_test_orchestrator import TelecomTestOrchestrator
 
 
+def print_tree(path, level=0):
+    """Print a directory tree using os.scandir's cached entry types."""
+    print(f"{'  ' * level}{os.path.basename(path) or path}/")
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            else:
+                print(f"{'  ' * (level + 1)}{entry.name}")
+    for subdir in subdirs:
+        print_tree(subdir, level + 1)
+
+
 async def test_framework_creation():
     """Test the framework creation process."""
     print("🧪 Testing Framework Creation")
@@ -42,26 +56,20 @@ async def test_framework_creation():
     
     # Test framework initialization
     print("2. Testing framework initialization...")
-    init_result = await orchestrator.initialize_framework()
-    print(f"Initialization result: {init_result}")
+    init_ok, init_info = await orchestrator.initialize_framework()
+    print(f"Initialization result: {init_ok}, {init_info}")
     print()
     
-    # Verify framework creation
+    # Verify framework creation (initialize_framework already re-detects)
     print("3. Verifying framework creation...")
-    verification_result = await orchestrator.detect_existing_framework()
+    verification_result = init_info.get('verification_result')
     print(f"Verification result: {verification_result}")
     print()
     
     # List created files and directories
     print("4. Listing created files and directories:")
     if os.path.exists(test_output_dir):
-        for root, dirs, files in os.walk(test_output_dir):
-            level = root.replace(test_output_dir, '').count(os.sep)
-            indent = ' ' * 2 * level
-            print(f"{indent}{os.path.basename(root)}/")
-            subindent = ' ' * 2 * (level + 1)
-            for file in files:
-                print(f"{subindent}{file}")
+        print_tree(test_output_dir)
     else:
         print("❌ Output directory was not created!")
     